@@ -3,7 +3,7 @@
 All values stored in SI units internally.
 """
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from src.constants import AIR_CP, AIR_DENSITY
@@ -22,7 +22,19 @@ class SolveMode(Enum):
     HEATER = "Solve heater requirement"
 
 
-@dataclass
+# Built once at import so selectbox options are the same object every rerun
+SOLVE_MODES: tuple[SolveMode, ...] = tuple(SolveMode)
+COOLING_TYPES: tuple[str, ...] = tuple(ct.value for ct in CoolingType)
+
+SOLVE_MODE_DESCRIPTIONS: dict[SolveMode, str] = {
+    SolveMode.AIRFLOW:   "\u2192 computing required airflow rate",
+    SolveMode.COOLANT:   "\u2192 computing coolant flow rate",
+    SolveMode.COIL_TEMP: "\u2192 computing coil leaving temperature",
+    SolveMode.HEATER:    "\u2192 computing heater requirement",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Enclosure:
     length_m: float
     width_m: float
@@ -30,31 +42,34 @@ class Enclosure:
     air_density: float = AIR_DENSITY
     air_cp: float = AIR_CP
     internal_thermal_mass: float = 50000.0  # J/K
-
-    @property
-    def volume_m3(self) -> float:
-        return self.length_m * self.width_m * self.height_m
-
-    @property
-    def thermal_capacitance(self) -> float:
-        """C_e = ρ·V·c_p + C_internal (J/K)."""
-        return (
-            self.air_density * self.volume_m3 * self.air_cp
-            + self.internal_thermal_mass
+    # Derived once in __post_init__ (slots leave no __dict__ for cached_property)
+    volume_m3: float = field(init=False, repr=False, compare=False)
+    thermal_capacitance: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        volume = self.length_m * self.width_m * self.height_m
+        object.__setattr__(self, "volume_m3", volume)
+        # C_e = ρ·V·c_p + C_internal (J/K)
+        object.__setattr__(
+            self,
+            "thermal_capacitance",
+            self.air_density * volume * self.air_cp + self.internal_thermal_mass,
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HeatLoads:
     baseline_load_w: float = 100.0
     additional_loads_w: float = 0.0
+    total_load_w: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def total_load_w(self) -> float:
-        return self.baseline_load_w + self.additional_loads_w
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "total_load_w", self.baseline_load_w + self.additional_loads_w
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class CoolingPlant:
     cooling_type: CoolingType = CoolingType.AIR_COIL
     coil_approach_temp_c: float = 2.0
@@ -64,7 +79,7 @@ class CoolingPlant:
     delta_t_water_c: float = 2.0
 
 
-@dataclass
+@dataclass(slots=True)
 class AmbientConditions:
     temperature_c: float = 23.5
     variation_amplitude_c: float = 2.0
@@ -1,7 +1,7 @@
 """Steady-state thermal solvers for enclosure sizing.
 
 All functions are pure — no UI dependency. Take SI values, return SI values.
-Unit conversion is the caller's responsibility.
+Result tuples also expose the display-unit flows (CFM, L/min) as properties.
 
 Physics reference:
   Airflow:  m_dot = Q / (c_p * ΔT_air)
@@ -10,13 +10,15 @@ Physics reference:
   Heater:   needed when UA*(T_set - T_amb) > Q_load
 """
 from __future__ import annotations
-from dataclasses import dataclass, field
+from typing import NamedTuple
 
-from src.constants import AIR_CP, AIR_DENSITY, WATER_CP
+from src.constants import (
+    AIR_CP, AIR_DENSITY, WATER_CP, ACH_TO_UA_FACTOR,
+    M3S_TO_CFM, KGS_TO_LPM_WATER,
+)
 
 
-@dataclass
-class SolverResult:
+class SolverResult(NamedTuple):
     """Container for all solver outputs."""
     airflow_m3s: float = 0.0
     airflow_kgs: float = 0.0
@@ -24,7 +26,33 @@ class SolverResult:
     coil_leaving_temp_c: float = 0.0
     heater_required_w: float = 0.0
     coil_utilization_pct: float = 0.0
-    warnings: list[str] = field(default_factory=list)
+    warnings: tuple[str, ...] = ()
+
+    @property
+    def airflow_cfm(self) -> float:
+        return self.airflow_m3s * M3S_TO_CFM
+
+    @property
+    def coolant_lpm(self) -> float:
+        return self.coolant_kgs * KGS_TO_LPM_WATER
+
+
+class SteadyStateResult(NamedTuple):
+    """All steady-state outputs from a single fused solve."""
+    airflow_m3s: float
+    airflow_kgs: float
+    coolant_kgs: float
+    coil_leaving_temp_c: float
+    heater_required_w: float
+    coil_utilization_pct: float
+
+    @property
+    def airflow_cfm(self) -> float:
+        return self.airflow_m3s * M3S_TO_CFM
+
+    @property
+    def coolant_lpm(self) -> float:
+        return self.coolant_kgs * KGS_TO_LPM_WATER
 
 
 def solve_airflow(
@@ -38,9 +66,10 @@ def solve_airflow(
     m_dot_air = Q / (c_p * ΔT_air)
     V_dot_air = m_dot_air / ρ
     """
-    if delta_t_air_c == 0:
-        raise ValueError("ΔT_air cannot be zero")
-    m_dot = q_total_w / (air_cp * delta_t_air_c)
+    try:
+        m_dot = q_total_w / (air_cp * delta_t_air_c)
+    except ZeroDivisionError:
+        raise ValueError("ΔT_air cannot be zero") from None
     v_dot = m_dot / air_density
     return SolverResult(airflow_m3s=v_dot, airflow_kgs=m_dot)
 
@@ -54,9 +83,10 @@ def solve_coolant_flow(
 
     m_dot_water = Q / (c_p_water * ΔT_water)
     """
-    if delta_t_water_c == 0:
-        raise ValueError("ΔT_water cannot be zero")
-    m_dot = q_total_w / (water_cp * delta_t_water_c)
+    try:
+        m_dot = q_total_w / (water_cp * delta_t_water_c)
+    except ZeroDivisionError:
+        raise ValueError("ΔT_water cannot be zero") from None
     return SolverResult(coolant_kgs=m_dot)
 
 
@@ -70,9 +100,10 @@ def solve_coil_leaving_temp(
 
     T_coil_out = T_return - Q / (m_dot_air * c_p)
     """
-    if airflow_kgs == 0:
-        raise ValueError("Airflow mass rate cannot be zero")
-    delta_t = q_total_w / (airflow_kgs * air_cp)
+    try:
+        delta_t = q_total_w / (airflow_kgs * air_cp)
+    except ZeroDivisionError:
+        raise ValueError("Airflow mass rate cannot be zero") from None
     t_out = return_air_temp_c - delta_t
     return SolverResult(coil_leaving_temp_c=t_out)
 
@@ -95,25 +126,90 @@ def solve_heater_requirement(
     return SolverResult(heater_required_w=heater_w)
 
 
+def solve_steady_state(
+    q_total_w: float,
+    delta_t_air_c: float,
+    delta_t_water_c: float,
+    ua_value: float,
+    ambient_temp_c: float,
+    setpoint_c: float,
+    coil_max_capacity_w: float,
+    air_cp: float = AIR_CP,
+    air_density: float = AIR_DENSITY,
+    water_cp: float = WATER_CP,
+) -> SteadyStateResult:
+    """Solve airflow, coolant flow, coil temp, heater and coil utilization at once.
+
+    Same equations as the individual solvers, evaluated inline. Return air
+    is taken at the setpoint (well-mixed enclosure).
+    """
+    try:
+        m_dot_air = q_total_w / (air_cp * delta_t_air_c)
+    except ZeroDivisionError:
+        raise ValueError("ΔT_air cannot be zero") from None
+    try:
+        m_dot_water = q_total_w / (water_cp * delta_t_water_c)
+    except ZeroDivisionError:
+        raise ValueError("ΔT_water cannot be zero") from None
+    # Q / (m_dot_air * c_p) reduces to ΔT_air when airflow is sized for Q
+    t_out = setpoint_c - delta_t_air_c
+    heater_w = max(0.0, ua_value * (setpoint_c - ambient_temp_c) - q_total_w)
+    return SteadyStateResult(
+        airflow_m3s=m_dot_air / air_density,
+        airflow_kgs=m_dot_air,
+        coolant_kgs=m_dot_water,
+        coil_leaving_temp_c=t_out,
+        heater_required_w=heater_w,
+        coil_utilization_pct=q_total_w / coil_max_capacity_w * 100.0,
+    )
+
+
+def ach_to_ua(ach: float, volume_m3: float) -> float:
+    """Convert an infiltration rate in air changes per hour to UA (W/K).
+
+    UA = ACH * V * ρ * c_p / 3600
+    """
+    return ach * volume_m3 * ACH_TO_UA_FACTOR
+
+
+class Warnings(NamedTuple):
+    """Warning messages grouped by how the UI should present them."""
+    errors: tuple[str, ...] = ()
+    warnings: tuple[str, ...] = ()
+    infos: tuple[str, ...] = ()
+
+
+_NO_WARNINGS = Warnings()
+
+_WARN_THRESHOLD_SAT = 100.0   # % coil utilization — saturated
+_WARN_THRESHOLD_HIGH = 90.0   # % coil utilization — low margin
+
+_WARN_SATURATED = (
+    "COOLING SATURATED: Coil utilization at {:.0f}%. "
+    "Increase coil capacity or reduce heat load."
+)
+_WARN_HIGH_UTILIZATION = (
+    "High coil utilization: {:.0f}%. "
+    "Limited cooling margin remaining."
+)
+_WARN_HEATER = (
+    "Heater required: {:.1f} W to maintain setpoint "
+    "under current ambient conditions."
+)
+
+
 def compute_warnings(
     coil_utilization_pct: float,
     heater_required_w: float,
-) -> list[str]:
-    """Generate warning messages based on solver results."""
-    warnings = []
-    if coil_utilization_pct > 100.0:
-        warnings.append(
-            f"COOLING SATURATED: Coil utilization at {coil_utilization_pct:.0f}%. "
-            "Increase coil capacity or reduce heat load."
-        )
-    elif coil_utilization_pct > 90.0:
-        warnings.append(
-            f"High coil utilization: {coil_utilization_pct:.0f}%. "
-            "Limited cooling margin remaining."
-        )
+) -> Warnings:
+    """Generate warning messages based on solver results, grouped by severity."""
+    if coil_utilization_pct <= _WARN_THRESHOLD_HIGH and heater_required_w <= 0.0:
+        return _NO_WARNINGS
+    errors = warnings = infos = ()
+    if coil_utilization_pct > _WARN_THRESHOLD_SAT:
+        errors = (_WARN_SATURATED.format(coil_utilization_pct),)
+    elif coil_utilization_pct > _WARN_THRESHOLD_HIGH:
+        warnings = (_WARN_HIGH_UTILIZATION.format(coil_utilization_pct),)
     if heater_required_w > 0.0:
-        warnings.append(
-            f"Heater required: {heater_required_w:.1f} W to maintain setpoint "
-            "under current ambient conditions."
-        )
-    return warnings
+        infos = (_WARN_HEATER.format(heater_required_w),)
+    return Warnings(errors=errors, warnings=warnings, infos=infos)
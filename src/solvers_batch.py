@@ -0,0 +1,53 @@
+"""Vectorized steady-state solver for parameter sweeps.
+
+Same physics as `solve_steady_state` in src/solvers.py, evaluated over
+NumPy arrays in one pass instead of one Python call per operating point.
+Inputs broadcast against each other, so a sweep over a single parameter
+can pass scalars for the rest. The scalar solvers remain the path for
+single-point UI use.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from src.constants import AIR_CP, AIR_DENSITY, WATER_CP
+from src.solvers import SteadyStateResult
+
+
+def solve_steady_state_batch(
+    q_total_w: ArrayLike,
+    delta_t_air_c: ArrayLike,
+    delta_t_water_c: ArrayLike,
+    ua_value: ArrayLike,
+    ambient_temp_c: ArrayLike,
+    setpoint_c: ArrayLike,
+    coil_max_capacity_w: ArrayLike,
+    air_cp: float = AIR_CP,
+    air_density: float = AIR_DENSITY,
+    water_cp: float = WATER_CP,
+) -> SteadyStateResult:
+    """Solve the steady state at every broadcast operating point.
+
+    Returns a SteadyStateResult whose fields are float arrays of the
+    broadcast input shape.
+    """
+    q, dt_air, dt_water, ua, t_amb, t_set, cap = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (
+            q_total_w, delta_t_air_c, delta_t_water_c, ua_value,
+            ambient_temp_c, setpoint_c, coil_max_capacity_w,
+        ))
+    )
+    if np.any(dt_air == 0):
+        raise ValueError("ΔT_air cannot be zero")
+    if np.any(dt_water == 0):
+        raise ValueError("ΔT_water cannot be zero")
+    m_dot_air = q / (air_cp * dt_air)
+    return SteadyStateResult(
+        airflow_m3s=m_dot_air / air_density,
+        airflow_kgs=m_dot_air,
+        coolant_kgs=q / (water_cp * dt_water),
+        coil_leaving_temp_c=t_set - dt_air,
+        heater_required_w=np.maximum(0.0, ua * (t_set - t_amb) - q),
+        coil_utilization_pct=q / cap * 100.0,
+    )
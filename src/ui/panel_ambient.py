@@ -1,12 +1,22 @@
 """Panel 3: Ambient temperature and coupling inputs."""
+from typing import NamedTuple
+
 import streamlit as st
 
 
-def render_ambient_panel() -> dict:
+class AmbientInputs(NamedTuple):
+    temperature_c: float
+    variation_amplitude_c: float
+    variation_period_hr: float
+    ua_value: float  # W/K, or air changes per hour when ua_mode_is_ach
+    ua_mode_is_ach: bool
+
+
+def render_ambient_panel() -> AmbientInputs:
     """Render ambient condition inputs and return values in SI.
 
-    Returns dict with keys: temperature_c, variation_amplitude_c,
-    variation_period_hr, ua_value.
+    When ua_mode_is_ach is set, ua_value holds ACH and must be converted
+    to UA by the caller using the enclosure volume.
     """
     with st.expander("AMBIENT CONDITIONS", expanded=True):
         c1, c2 = st.columns(2)
@@ -53,10 +63,10 @@ def render_ambient_panel() -> dict:
             st.caption("Note: UA computed using enclosure volume from Panel 1")
             ua = ach  # Will be converted in app.py using actual volume
 
-    return {
-        "temperature_c": temp,
-        "variation_amplitude_c": variation,
-        "variation_period_hr": 24.0,
-        "ua_value": ua,
-        "ua_mode": ua_mode,
-    }
+    return AmbientInputs(
+        temperature_c=temp,
+        variation_amplitude_c=variation,
+        variation_period_hr=24.0,
+        ua_value=ua,
+        ua_mode_is_ach=ua_mode == "Air changes per hour (ACH)",
+    )
@@ -1,22 +1,33 @@
 """Panel 4: Cooling plant configuration inputs."""
+from typing import NamedTuple
+
 import streamlit as st
-from src.models import CoolingType, SolveMode
+from src.models import COOLING_TYPES, SolveMode
+
+_COOLING_LABELS: dict[str, str] = {
+    "air_coil": "Air Coil",
+    "liquid": "Liquid",
+    "hybrid": "Hybrid",
+}
+
 
+class CoolingInputs(NamedTuple):
+    """Field names match CoolingPlant; cooling_type is the CoolingType value."""
+    cooling_type: str
+    coil_approach_temp_c: float
+    coil_max_capacity_w: float
+    chilled_water_temp_c: float
+    delta_t_air_c: float
+    delta_t_water_c: float
 
-def render_cooling_panel(solve_mode: SolveMode) -> dict:
-    """Render cooling plant inputs. Some fields are disabled based on solve mode.
 
-    Returns dict with keys matching CoolingPlant fields.
-    """
+def render_cooling_panel(solve_mode: SolveMode) -> CoolingInputs:
+    """Render cooling plant inputs. Some fields are disabled based on solve mode."""
     with st.expander("COOLING PLANT", expanded=True):
         cooling_type = st.selectbox(
             "Cooling type",
-            options=[ct.value for ct in CoolingType],
-            format_func=lambda x: {
-                "air_coil": "Air Coil",
-                "liquid": "Liquid",
-                "hybrid": "Hybrid",
-            }[x],
+            options=COOLING_TYPES,
+            format_func=_COOLING_LABELS.__getitem__,
         )
 
         c1, c2 = st.columns(2)
@@ -79,11 +90,11 @@ def render_cooling_panel(solve_mode: SolveMode) -> dict:
             label_visibility="collapsed" if solving_airflow else "visible",
         )
 
-    return {
-        "cooling_type": cooling_type,
-        "coil_approach_temp_c": approach,
-        "coil_max_capacity_w": max_cap,
-        "chilled_water_temp_c": chilled_water_temp,
-        "delta_t_air_c": delta_t_air,
-        "delta_t_water_c": delta_t_water,
-    }
+    return CoolingInputs(
+        cooling_type=cooling_type,
+        coil_approach_temp_c=approach,
+        coil_max_capacity_w=max_cap,
+        chilled_water_temp_c=chilled_water_temp,
+        delta_t_air_c=delta_t_air,
+        delta_t_water_c=delta_t_water,
+    )
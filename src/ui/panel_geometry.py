@@ -1,13 +1,19 @@
 """Panel 1: Enclosure geometry and thermal mass inputs."""
+from typing import NamedTuple
+
 import streamlit as st
 from src.units import ft_to_m, m_to_ft, ft3_to_m3, m3_to_ft3
 
 
-def render_geometry_panel(use_imperial: bool) -> dict:
-    """Render geometry inputs and return values in SI.
+class GeometryInputs(NamedTuple):
+    length_m: float
+    width_m: float
+    height_m: float
+    internal_thermal_mass: float  # J/K
+
 
-    Returns dict with keys: length_m, width_m, height_m, internal_thermal_mass.
-    """
+def render_geometry_panel(use_imperial: bool) -> GeometryInputs:
+    """Render geometry inputs and return values in SI."""
     with st.expander("GEOMETRY & PROPERTIES", expanded=True):
         if use_imperial:
             c1, c2, c3 = st.columns(3)
@@ -46,9 +52,9 @@ def render_geometry_panel(use_imperial: bool) -> dict:
             help="Thermal mass of hardware inside enclosure (laser, optics, mounts)",
         )
 
-    return {
-        "length_m": length_m,
-        "width_m": width_m,
-        "height_m": height_m,
-        "internal_thermal_mass": internal_mass * 1000.0,  # kJ → J
-    }
+    return GeometryInputs(
+        length_m=length_m,
+        width_m=width_m,
+        height_m=height_m,
+        internal_thermal_mass=internal_mass * 1000.0,  # kJ → J
+    )
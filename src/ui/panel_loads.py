@@ -1,12 +1,16 @@
 """Panel 2: Internal heat load inputs."""
+from typing import NamedTuple
+
 import streamlit as st
 
 
-def render_loads_panel() -> dict:
-    """Render heat load inputs and return values in watts.
+class LoadsInputs(NamedTuple):
+    baseline_load_w: float
+    additional_loads_w: float
+
 
-    Returns dict with keys: baseline_load_w, additional_loads_w.
-    """
+def render_loads_panel() -> LoadsInputs:
+    """Render heat load inputs and return values in watts."""
     with st.expander("HEAT LOADS", expanded=True):
         baseline = st.number_input(
             "Baseline load (W)",
@@ -22,10 +26,9 @@ def render_loads_panel() -> dict:
             step=5.0,
             help="Sum of secondary heat sources (electronics, pumps, etc.)",
         )
-        total = baseline + additional
-        st.markdown(f"**Total load:** `{total:.1f}` W")
+        st.caption(f"Total load: {baseline + additional:.1f} W")
 
-    return {
-        "baseline_load_w": baseline,
-        "additional_loads_w": additional,
-    }
+    return LoadsInputs(
+        baseline_load_w=baseline,
+        additional_loads_w=additional,
+    )
@@ -1,30 +1,56 @@
 """Panel 6: Computed results display with metric cards and warnings."""
 import streamlit as st
 from src.models import SolveMode
-from src.units import m3s_to_cfm, kgs_to_lpm, lpm_to_gpm
+from src.solvers import Warnings
+from src.constants import LPM_TO_GPM
+
+_SECTION_HEADER_HTML = '<div class="section-header">COMPUTED RESULTS</div>'
+
+
+def _metric_card(label: str, value: str, delta: str = "", css_class: str = "") -> str:
+    """Return HTML for one metric card, styled like st.metric by the theme."""
+    delta_html = f'<div class="metric-card-delta">{delta}</div>' if delta else ""
+    return (
+        f'<div class="metric-card {css_class}">'
+        f'<div class="metric-card-label">{label}</div>'
+        f'<div class="metric-card-value">{value}</div>'
+        f'{delta_html}'
+        f'</div>'
+    )
+
+
+def _util_state(highlight: bool, utilization_pct: float) -> tuple[str, str]:
+    """Return (card class, bar color) for the coil utilization card.
+
+    Solving highlight takes priority, otherwise error/warning state.
+    """
+    if highlight:
+        return "metric-solving", "#FF6B35"
+    if utilization_pct > 100:
+        return "metric-error", "#F85149"
+    if utilization_pct > 90:
+        return "metric-warning", "#F0A830"
+    return "", "#00D4AA"
 
 
 def render_results_panel(
     airflow_m3s: float,
-    coolant_kgs: float,
+    airflow_cfm: float,
+    coolant_lpm: float,
     coil_utilization_pct: float,
     heater_required_w: float,
     coil_leaving_temp_c: float,
-    warnings: list[str],
+    warnings: Warnings,
     solve_mode: SolveMode = SolveMode.AIRFLOW,
 ) -> None:
     """Render computed results as metric cards with dual-unit display.
 
     The card corresponding to the active solve_mode is highlighted in orange.
+    Flows arrive already converted so the caller's conversions are reused.
     """
-    st.markdown(
-        '<div class="section-header">COMPUTED RESULTS</div>',
-        unsafe_allow_html=True,
-    )
+    st.markdown(_SECTION_HEADER_HTML, unsafe_allow_html=True)
 
-    cfm = m3s_to_cfm(airflow_m3s)
-    lpm = kgs_to_lpm(coolant_kgs)
-    gpm = lpm_to_gpm(lpm)
+    gpm = coolant_lpm * LPM_TO_GPM
 
     # Determine which card to highlight
     highlight_airflow = solve_mode == SolveMode.AIRFLOW
@@ -32,81 +58,62 @@ def render_results_panel(
     highlight_coil = solve_mode == SolveMode.COIL_TEMP
     highlight_heater = solve_mode == SolveMode.HEATER
 
-    # Top row: 2 metrics
-    r1c1, r1c2 = st.columns(2)
+    # All four metrics in one row
+    c1, c2, c3, c4 = st.columns(4)
 
-    with r1c1:
-        css_class = "metric-solving" if highlight_airflow else ""
-        st.markdown(f'<div class="{css_class}">', unsafe_allow_html=True)
-        st.metric(
-            label="REQUIRED AIRFLOW",
-            value=f"{cfm:.1f} CFM",
-            delta=f"{airflow_m3s:.4f} m\u00b3/s",
-        )
-        st.markdown("</div>", unsafe_allow_html=True)
-
-    with r1c2:
-        css_class = "metric-solving" if highlight_coolant else ""
-        st.markdown(f'<div class="{css_class}">', unsafe_allow_html=True)
-        st.metric(
-            label="COOLANT FLOW",
-            value=f"{lpm:.2f} L/min",
-            delta=f"{gpm:.3f} GPM",
+    with c1:
+        st.markdown(
+            _metric_card(
+                label="REQUIRED AIRFLOW",
+                value=f"{airflow_cfm:.1f} CFM",
+                delta=f"{airflow_m3s:.4f} m\u00b3/s",
+                css_class="metric-solving" if highlight_airflow else "",
+            ),
+            unsafe_allow_html=True,
         )
-        st.markdown("</div>", unsafe_allow_html=True)
-
-    # Bottom row: 2 metrics
-    r2c1, r2c2 = st.columns(2)
-
-    with r2c1:
-        # Coil utilization with color-coded wrapper
-        # Solving highlight takes priority, otherwise error/warning state
-        if highlight_coil:
-            wrapper_class = "metric-solving"
-        elif coil_utilization_pct > 100:
-            wrapper_class = "metric-error"
-        elif coil_utilization_pct > 90:
-            wrapper_class = "metric-warning"
-        else:
-            wrapper_class = ""
-
-        st.markdown(f'<div class="{wrapper_class}">', unsafe_allow_html=True)
-        st.metric(
-            label="COIL UTILIZATION",
-            value=f"{coil_utilization_pct:.0f}%",
-            delta=(
-                f"of {coil_utilization_pct / 100 * 500:.0f} W capacity"
-                if coil_utilization_pct <= 100
-                else "OVER CAPACITY"
+
+    with c2:
+        st.markdown(
+            _metric_card(
+                label="COOLANT FLOW",
+                value=f"{coolant_lpm:.2f} L/min",
+                delta=f"{gpm:.3f} GPM",
+                css_class="metric-solving" if highlight_coolant else "",
             ),
+            unsafe_allow_html=True,
         )
-        st.markdown("</div>", unsafe_allow_html=True)
-
-        # Utilization bar
-        if highlight_coil:
-            bar_color = "#FF6B35"
-        elif coil_utilization_pct > 100:
-            bar_color = "#F85149"
-        elif coil_utilization_pct > 90:
-            bar_color = "#F0A830"
-        else:
-            bar_color = "#00D4AA"
+
+    with c3:
+        wrapper_class, bar_color = _util_state(highlight_coil, coil_utilization_pct)
         bar_width = min(coil_utilization_pct, 100)
+
+        # Card and bar go out as one element
         st.markdown(
-            f'<div class="util-bar-track">'
+            _metric_card(
+                label="COIL UTILIZATION",
+                value=f"{coil_utilization_pct:.0f}%",
+                delta=(
+                    f"of {coil_utilization_pct / 100 * 500:.0f} W capacity"
+                    if coil_utilization_pct <= 100
+                    else "OVER CAPACITY"
+                ),
+                css_class=wrapper_class,
+            )
+            + f'<div class="util-bar-track">'
             f'<div class="util-bar-fill" style="background:{bar_color};width:{bar_width}%"></div>'
             f'</div>',
             unsafe_allow_html=True,
         )
 
-    with r2c2:
-        css_class = "metric-solving" if highlight_heater else ""
-        st.markdown(f'<div class="{css_class}">', unsafe_allow_html=True)
-        st.metric(
-            label="HEATER REQUIRED",
-            value=f"{heater_required_w:.1f} W",
+    with c4:
+        st.markdown(
+            _metric_card(
+                label="HEATER REQUIRED",
+                value=f"{heater_required_w:.1f} W",
+                css_class="metric-solving" if highlight_heater else "",
+            ),
+            unsafe_allow_html=True,
         )
-        st.markdown("</div>", unsafe_allow_html=True)
 
     # Coil leaving temp as a subtle readout
     st.markdown(
@@ -117,11 +124,9 @@ def render_results_panel(
     )
 
     # Warnings
-    if warnings:
-        for w in warnings:
-            if "SATURATED" in w.upper():
-                st.error(w)
-            elif "heater" in w.lower():
-                st.info(w)
-            else:
-                st.warning(w)
+    for msg in warnings.errors:
+        st.error(msg)
+    for msg in warnings.warnings:
+        st.warning(msg)
+    for msg in warnings.infos:
+        st.info(msg)
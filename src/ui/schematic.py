@@ -11,152 +11,233 @@ Layout coordinates (x: 0–13, y: 0–10, no scaleanchor):
   Coolant        : below coil, arrow from y=1.8 → 3.0
 """
 import plotly.graph_objects as go
+import streamlit as st
 
+BG       = "#0D1117"
+PANEL    = "#161B22"
+TEAL     = "#00D4AA"
+BLUE     = "#58A6FF"
+TEXT     = "#E6EDF3"
+MUTED    = "#8B949E"
+AMBER    = "#F0A830"
+DIVIDER  = "#30363D"
 
-def render_schematic(
-    enclosure_temp_c: float,
-    supply_temp_c: float,
-    return_temp_c: float,
-    ambient_temp_c: float,
-    chilled_water_temp_c: float,
-    airflow_cfm: float,
-    coolant_lpm: float,
-    heat_load_w: float,
-    ua_value: float,
-) -> go.Figure:
-    """Build and return a Plotly figure of the thermal system schematic."""
-    fig = go.Figure()
-
-    BG       = "#0D1117"
-    PANEL    = "#161B22"
-    TEAL     = "#00D4AA"
-    BLUE     = "#58A6FF"
-    TEXT     = "#E6EDF3"
-    MUTED    = "#8B949E"
-    AMBER    = "#F0A830"
-    DIVIDER  = "#30363D"
+# Style dicts and input-independent shapes, built once at import
+_FONT_ENCL_TITLE = dict(color=TEXT, size=14, family="DM Sans")
+_FONT_ENCL_TEMP  = dict(color=TEAL, size=17, family="JetBrains Mono")
+_FONT_LOAD       = dict(color=AMBER, size=13, family="JetBrains Mono")
+_FONT_UA         = dict(color=MUTED, size=11, family="JetBrains Mono")
+_FONT_COIL_TITLE = dict(color=TEXT, size=13, family="DM Sans")
+_FONT_COIL_TEMP  = dict(color=BLUE, size=14, family="JetBrains Mono")
+_FONT_CW         = dict(color=BLUE, size=12, family="JetBrains Mono")
+_FONT_RETURN     = dict(color=MUTED, size=11, family="JetBrains Mono")
+_FONT_SUPPLY     = dict(color=TEAL, size=11, family="JetBrains Mono")
+_FONT_AMBIENT    = dict(color=MUTED, size=12, family="JetBrains Mono")
+_FONT_COOLANT    = dict(color=BLUE, size=11, family="JetBrains Mono")
 
+_SHAPES = (
     # ── Subtle gap divider lines ────────────────────────
-    for x in (5.5, 8.5):
-        fig.add_shape(
+    *(
+        dict(
             type="line", x0=x, y0=2.8, x1=x, y1=7.2,
             line=dict(color=DIVIDER, width=1, dash="dot"),
         )
-
+        for x in (5.5, 8.5)
+    ),
     # ── Enclosure box ───────────────────────────────────
-    fig.add_shape(
+    dict(
         type="rect", x0=0.5, y0=2.5, x1=5.5, y1=7.5,
         line=dict(color=TEAL, width=2.5),
         fillcolor=PANEL,
-    )
-    fig.add_annotation(
+    ),
+    # ── Coil / HX box ───────────────────────────────────
+    dict(
+        type="rect", x0=8.5, y0=3.0, x1=12.5, y1=7.0,
+        line=dict(color=BLUE, width=2.5),
+        fillcolor=PANEL,
+    ),
+)
+
+
+# Annotation skeleton; value labels get their text from _ANNOT_SLOTS
+_ANNOTATIONS = (
+    # ── Enclosure labels ────────────────────────────
+    dict(
         x=3.0, y=7.05, text="<b>ENCLOSURE</b>",
-        font=dict(color=TEXT, size=14, family="DM Sans"),
+        font=_FONT_ENCL_TITLE,
         showarrow=False,
-    )
-    fig.add_annotation(
-        x=3.0, y=5.8, text=f"T = {enclosure_temp_c:.1f} °C",
-        font=dict(color=TEAL, size=17, family="JetBrains Mono"),
+    ),
+    dict(
+        x=3.0, y=5.8,
+        font=_FONT_ENCL_TEMP,
         showarrow=False,
-    )
-    fig.add_annotation(
-        x=3.0, y=4.55, text=f"Q<sub>load</sub> = {heat_load_w:.0f} W",
-        font=dict(color=AMBER, size=13, family="JetBrains Mono"),
+    ),
+    dict(
+        x=3.0, y=4.55,
+        font=_FONT_LOAD,
         showarrow=False,
-    )
-    fig.add_annotation(
-        x=3.0, y=3.45, text=f"UA = {ua_value:.1f} W/K",
-        font=dict(color=MUTED, size=11, family="JetBrains Mono"),
+    ),
+    dict(
+        x=3.0, y=3.45,
+        font=_FONT_UA,
         showarrow=False,
-    )
-
-    # ── Coil / HX box ───────────────────────────────────
-    fig.add_shape(
-        type="rect", x0=8.5, y0=3.0, x1=12.5, y1=7.0,
-        line=dict(color=BLUE, width=2.5),
-        fillcolor=PANEL,
-    )
-    fig.add_annotation(
+    ),
+    # ── Coil / HX labels ────────────────────────────
+    dict(
         x=10.5, y=6.55, text="<b>COIL / HX</b>",
-        font=dict(color=TEXT, size=13, family="DM Sans"),
+        font=_FONT_COIL_TITLE,
         showarrow=False,
-    )
-    fig.add_annotation(
-        x=10.5, y=5.5, text=f"T<sub>sup</sub> = {supply_temp_c:.1f} °C",
-        font=dict(color=BLUE, size=14, family="JetBrains Mono"),
+    ),
+    dict(
+        x=10.5, y=5.5,
+        font=_FONT_COIL_TEMP,
         showarrow=False,
-    )
-    fig.add_annotation(
-        x=10.5, y=4.4, text=f"CW = {chilled_water_temp_c:.0f} °C",
-        font=dict(color=BLUE, size=12, family="JetBrains Mono"),
+    ),
+    dict(
+        x=10.5, y=4.4,
+        font=_FONT_CW,
         showarrow=False,
-    )
-
+    ),
     # ── Return air: enclosure → coil (top of gap, y=6.5) ─
-    fig.add_annotation(
+    dict(
         x=8.5, y=6.5, ax=5.5, ay=6.5,
         xref="x", yref="y", axref="x", ayref="y",
         showarrow=True, arrowhead=2, arrowsize=1.6,
         arrowcolor=MUTED, arrowwidth=2.5,
-    )
-    fig.add_annotation(
+    ),
+    dict(
         x=7.0, y=7.05,
-        text=f"Return  {return_temp_c:.1f} °C",
-        font=dict(color=MUTED, size=11, family="JetBrains Mono"),
+        font=_FONT_RETURN,
         showarrow=False,
-    )
-
+    ),
     # ── Supply air: coil → enclosure (bottom of gap, y=3.5) ─
-    fig.add_annotation(
+    dict(
         x=5.5, y=3.5, ax=8.5, ay=3.5,
         xref="x", yref="y", axref="x", ayref="y",
         showarrow=True, arrowhead=2, arrowsize=1.6,
         arrowcolor=TEAL, arrowwidth=2.5,
-    )
-    fig.add_annotation(
+    ),
+    dict(
         x=7.0, y=2.9,
-        text=f"Supply  {supply_temp_c:.1f} °C  ·  {airflow_cfm:.0f} CFM",
-        font=dict(color=TEAL, size=11, family="JetBrains Mono"),
+        font=_FONT_SUPPLY,
         showarrow=False,
-    )
-
-    # ── Ambient coupling (above enclosure) ─────────────
-    fig.add_annotation(
+    ),
+    # ── Ambient coupling (above enclosure) ─────────
+    dict(
         x=3.0, y=7.5, ax=3.0, ay=9.1,
         xref="x", yref="y", axref="x", ayref="y",
         showarrow=True, arrowhead=3, arrowsize=1.4,
         arrowcolor=MUTED, arrowwidth=2,
-    )
-    fig.add_annotation(
+    ),
+    dict(
         x=3.0, y=9.45,
-        text=f"Ambient  {ambient_temp_c:.1f} °C",
-        font=dict(color=MUTED, size=12, family="JetBrains Mono"),
+        font=_FONT_AMBIENT,
         showarrow=False,
-    )
-
-    # ── Coolant supply (below coil) ─────────────────────
-    fig.add_annotation(
+    ),
+    # ── Coolant supply (below coil) ─────────────────
+    dict(
         x=10.5, y=3.0, ax=10.5, ay=1.9,
         xref="x", yref="y", axref="x", ayref="y",
         showarrow=True, arrowhead=3, arrowsize=1.3,
         arrowcolor=BLUE, arrowwidth=2,
-    )
-    fig.add_annotation(
+    ),
+    dict(
         x=10.5, y=1.45,
-        text=f"Coolant  {chilled_water_temp_c:.0f} °C  ·  {coolant_lpm:.2f} L/min",
-        font=dict(color=BLUE, size=11, family="JetBrains Mono"),
+        font=_FONT_COOLANT,
         showarrow=False,
-    )
+    ),
+)
 
-    # ── Layout ─────────────────────────────────────────
-    fig.update_layout(
-        xaxis=dict(visible=False, range=[0, 13]),
-        yaxis=dict(visible=False, range=[0, 10]),
-        plot_bgcolor=BG,
-        paper_bgcolor=BG,
-        margin=dict(l=5, r=5, t=5, b=5),
-        height=420,
-        font=dict(family="DM Sans"),
-    )
+# (annotation index, text format) for each value-bearing label
+_ANNOT_SLOTS = (
+    (1, "T = {enclosure_temp_c:.1f} °C"),
+    (2, "Q<sub>load</sub> = {heat_load_w} W"),
+    (3, "UA = {ua_value:.1f} W/K"),
+    (5, "T<sub>sup</sub> = {supply_temp_c:.1f} °C"),
+    (6, "CW = {chilled_water_temp_c} °C"),
+    (8, "Return  {return_temp_c:.1f} °C"),
+    (10, "Supply  {supply_temp_c:.1f} °C  ·  {airflow_cfm} CFM"),
+    (12, "Ambient  {ambient_temp_c:.1f} °C"),
+    (14, "Coolant  {chilled_water_temp_c} °C  ·  {coolant_lpm:.2f} L/min"),
+)
+
+# Input-independent layout; annotations are merged in per render
+_LAYOUT = dict(
+    shapes=_SHAPES,
+    xaxis=dict(visible=False, range=[0, 13]),
+    yaxis=dict(visible=False, range=[0, 10]),
+    plot_bgcolor=BG,
+    paper_bgcolor=BG,
+    margin=dict(l=5, r=5, t=5, b=5),
+    height=420,
+    font=dict(family="DM Sans"),
+)
+
+
+def render_schematic(
+    enclosure_temp_c: float,
+    supply_temp_c: float,
+    return_temp_c: float,
+    ambient_temp_c: float,
+    chilled_water_temp_c: float,
+    airflow_cfm: float,
+    coolant_lpm: float,
+    heat_load_w: float,
+    ua_value: float,
+) -> go.Figure:
+    """Build and return a Plotly figure of the thermal system schematic.
+
+    Inputs are rounded to the precision they are displayed at, so reruns
+    that would draw identical labels share one cached layout. The layout
+    is plain dicts of known-good properties, so the figure is constructed
+    without Plotly's per-property validation.
+    """
+    layout = _schematic_layout(
+        enclosure_temp_c=round(enclosure_temp_c, 1),
+        supply_temp_c=round(supply_temp_c, 1),
+        return_temp_c=round(return_temp_c, 1),
+        ambient_temp_c=round(ambient_temp_c, 1),
+        chilled_water_temp_c=round(chilled_water_temp_c),
+        airflow_cfm=round(airflow_cfm),
+        coolant_lpm=round(coolant_lpm, 2),
+        heat_load_w=round(heat_load_w),
+        ua_value=round(ua_value, 1),
+    )
+    return go.Figure(dict(data=[], layout=layout), _validate=False)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _schematic_layout(
+    enclosure_temp_c: float,
+    supply_temp_c: float,
+    return_temp_c: float,
+    ambient_temp_c: float,
+    chilled_water_temp_c: int,
+    airflow_cfm: int,
+    coolant_lpm: float,
+    heat_load_w: int,
+    ua_value: float,
+) -> dict:
+    """Return the schematic layout dict for already-rounded inputs.
+
+    Whole-number labels arrive as ints and are formatted without a float
+    format spec.
+    """
+    values = dict(
+        enclosure_temp_c=enclosure_temp_c,
+        supply_temp_c=supply_temp_c,
+        return_temp_c=return_temp_c,
+        ambient_temp_c=ambient_temp_c,
+        chilled_water_temp_c=chilled_water_temp_c,
+        airflow_cfm=airflow_cfm,
+        coolant_lpm=coolant_lpm,
+        heat_load_w=heat_load_w,
+        ua_value=ua_value,
+    )
+    texts = {i: fmt.format(**values) for i, fmt in _ANNOT_SLOTS}
+    annotations = [
+        {**ann, "text": texts[i]} if i in texts else ann
+        for i, ann in enumerate(_ANNOTATIONS)
+    ]
 
-    return fig
+    return {**_LAYOUT, "annotations": annotations}
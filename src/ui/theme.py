@@ -3,16 +3,26 @@
 Injected via st.markdown(unsafe_allow_html=True).
 Colors, typography, metric cards, layout refinements.
 """
+import re
 
-GOOGLE_FONTS = """
-<link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600&family=DM+Sans:ital,wght@0,400;0,500;0,700;1,400&display=swap" rel="stylesheet">
+import streamlit as st
+
+_FONTS_URL = (
+    "https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600"
+    "&family=DM+Sans:ital,wght@0,400;0,500;0,700;1,400&display=swap"
+)
+
+# Preconnect and preload let the font fetch start before the stylesheet applies
+GOOGLE_FONTS = f"""
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link rel="preload" as="style" href="{_FONTS_URL}">
+<link rel="stylesheet" href="{_FONTS_URL}">
 """
 
 CUSTOM_CSS = """
 <style>
     /* ── Global ────────────────────────────────────── */
-    @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600&family=DM+Sans:ital,wght@0,400;0,500;0,700;1,400&display=swap');
-
     .stApp {
         font-family: 'DM Sans', sans-serif;
     }
@@ -56,55 +66,55 @@ CUSTOM_CSS = """
     }
 
     /* ── Metric cards ──────────────────────────────── */
-    div[data-testid="stMetric"] {
+    /* State classes only swap custom properties on the card itself */
+    .metric-card {
+        --accent: #00D4AA;
+        --label-color: #8B949E;
+        --value-color: #E6EDF3;
         background-color: #161B22;
         border: 1px solid #30363D;
-        border-top: 3px solid #00D4AA;
+        border-top: 3px solid var(--accent);
         border-radius: 8px;
         padding: 0.75rem 0.75rem;
     }
-    div[data-testid="stMetric"] label {
+    .metric-card-label {
         font-family: 'DM Sans', sans-serif;
         font-weight: 500;
         text-transform: uppercase;
         letter-spacing: 0.05em;
         font-size: 0.75rem;
-        color: #8B949E;
+        color: var(--label-color);
     }
-    div[data-testid="stMetric"] div[data-testid="stMetricValue"] {
+    .metric-card-value {
         font-family: 'JetBrains Mono', monospace;
         font-weight: 600;
         font-size: 1.35rem;
-        color: #E6EDF3;
+        color: var(--value-color);
     }
-    div[data-testid="stMetric"] div[data-testid="stMetricDelta"] {
+    .metric-card-delta {
         font-family: 'JetBrains Mono', monospace;
         font-size: 0.8rem;
         color: #58A6FF;
     }
 
     /* ── Warning metric (amber top border) ─────────── */
-    .metric-warning div[data-testid="stMetric"] {
-        border-top-color: #F0A830;
+    .metric-warning {
+        --accent: #F0A830;
     }
 
     /* ── Error metric (red top border) ─────────────── */
-    .metric-error div[data-testid="stMetric"] {
-        border-top-color: #F85149;
+    .metric-error {
+        --accent: #F85149;
     }
 
     /* ── Active/solving metric (orange highlight) ───── */
-    .metric-solving div[data-testid="stMetric"] {
-        border-top: 3px solid #FF6B35 !important;
-        background: #FF6B3508 !important;
+    .metric-solving {
+        --accent: #FF6B35;
+        --label-color: #FF9A6C;
+        --value-color: #FF6B35;
+        background: #FF6B3508;
         box-shadow: 0 0 0 1px #FF6B3530, 0 2px 12px #FF6B3518;
     }
-    .metric-solving div[data-testid="stMetric"] label {
-        color: #FF9A6C !important;
-    }
-    .metric-solving div[data-testid="stMetric"] div[data-testid="stMetricValue"] {
-        color: #FF6B35 !important;
-    }
 
     /* ── Sidebar redesign ────────────────────────────── */
     section[data-testid="stSidebar"] {
@@ -183,18 +193,14 @@ CUSTOM_CSS = """
         line-height: 1.5;
     }
 
-    /* Sidebar selectbox label */
-    section[data-testid="stSidebar"] .stSelectbox label p {
+    /* Sidebar selectbox and toggle labels */
+    section[data-testid="stSidebar"] :is(.stSelectbox label, .stToggle) p {
         font-size: 0.9rem !important;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
         color: #8B949E !important;
     }
-
-    /* Sidebar toggle label */
-    section[data-testid="stSidebar"] .stToggle p {
-        font-size: 0.9rem;
-        color: #8B949E;
+    section[data-testid="stSidebar"] .stSelectbox label p {
+        text-transform: uppercase;
+        letter-spacing: 0.05em;
     }
 
     /* Sidebar status footer */
@@ -213,11 +219,16 @@ CUSTOM_CSS = """
         background: #00D4AA;
         box-shadow: 0 0 4px #00D4AA88;
         flex-shrink: 0;
-        animation: pulse 2.5s ease-in-out infinite;
+    }
+    /* Opacity-only pulse stays on the compositor; skipped for reduced motion */
+    @media (prefers-reduced-motion: no-preference) {
+        .sidebar-status-dot {
+            animation: pulse 2.5s ease-in-out infinite;
+        }
     }
     @keyframes pulse {
-        0%, 100% { opacity: 1; box-shadow: 0 0 4px #00D4AA88; }
-        50% { opacity: 0.5; box-shadow: 0 0 2px #00D4AA44; }
+        0%, 100% { opacity: 1; }
+        50% { opacity: 0.5; }
     }
     .sidebar-status-text {
         font-family: 'JetBrains Mono', monospace;
@@ -488,8 +499,41 @@ CUSTOM_CSS = """
 """
 
 
+
+def _minify(css: str) -> str:
+    """Strip comments and collapse whitespace in a block of CSS/HTML."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};])\s*", r"\1", css).strip()
+
+
+# Font link and stylesheet, minified once at import and sent as one element
+_THEME_HTML = _minify(GOOGLE_FONTS + CUSTOM_CSS)
+
+# Static sidebar chrome, built once at import and sent with its neighbouring
+# wrapper markup so each block costs a single st.markdown call.
+SIDEBAR_BRAND_HTML = (
+    '<div class="sidebar-brand">'
+    '<div class="sidebar-brand-dot"></div>'
+    '<div>'
+    '<div class="sidebar-brand-name">Thermal Analyzer</div>'
+    '<span class="sidebar-brand-tag">Quantum Lab Enclosures</span>'
+    '</div>'
+    '</div>'
+)
+
+SIDEBAR_STATUS_HTML = (
+    '<div class="sidebar-status">'
+    '<div class="sidebar-status-dot"></div>'
+    '<div class="sidebar-status-text">'
+    'Steady-state solver · '
+    '<span class="sidebar-phase-badge">PHASE 1</span>'
+    '<br>100 W laser enclosure sizing'
+    '</div>'
+    '</div>'
+)
+
+
 def inject_theme():
     """Call this at the top of app.py to apply the Precision Instrument theme."""
-    import streamlit as st
-    st.markdown(GOOGLE_FONTS, unsafe_allow_html=True)
-    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+    st.markdown(_THEME_HTML, unsafe_allow_html=True)
@@ -1,47 +1,55 @@
 """SI <-> Imperial unit conversion helpers.
 
 All functions are pure -- no side effects. Internal calculations always use SI.
-These helpers convert user-facing values to/from SI.
+These helpers convert user-facing values to/from SI. Each is a single multiply,
+so NumPy arrays convert elementwise in one vectorized pass.
 """
+from __future__ import annotations
+
+import numpy as np
+
 from src.constants import (
     FT_TO_M, M_TO_FT,
     FT3_TO_M3, M3_TO_FT3,
     CFM_TO_M3S, M3S_TO_CFM,
-    KGS_TO_LPM_WATER,
+    KGS_TO_LPM_WATER, KGS_TO_GPM_WATER,
     LPM_TO_GPM, GPM_TO_LPM,
 )
 
 
 # Length
-def ft_to_m(ft: float) -> float:
+def ft_to_m(ft: float | np.ndarray) -> float | np.ndarray:
     return ft * FT_TO_M
 
-def m_to_ft(m: float) -> float:
+def m_to_ft(m: float | np.ndarray) -> float | np.ndarray:
     return m * M_TO_FT
 
 
 # Volume
-def ft3_to_m3(ft3: float) -> float:
+def ft3_to_m3(ft3: float | np.ndarray) -> float | np.ndarray:
     return ft3 * FT3_TO_M3
 
-def m3_to_ft3(m3: float) -> float:
+def m3_to_ft3(m3: float | np.ndarray) -> float | np.ndarray:
     return m3 * M3_TO_FT3
 
 
 # Airflow
-def cfm_to_m3s(cfm: float) -> float:
+def cfm_to_m3s(cfm: float | np.ndarray) -> float | np.ndarray:
     return cfm * CFM_TO_M3S
 
-def m3s_to_cfm(m3s: float) -> float:
+def m3s_to_cfm(m3s: float | np.ndarray) -> float | np.ndarray:
     return m3s * M3S_TO_CFM
 
 
 # Liquid flow (water)
-def kgs_to_lpm(kgs: float) -> float:
+def kgs_to_lpm(kgs: float | np.ndarray) -> float | np.ndarray:
     return kgs * KGS_TO_LPM_WATER
 
-def lpm_to_gpm(lpm: float) -> float:
+def kgs_to_gpm(kgs: float | np.ndarray) -> float | np.ndarray:
+    return kgs * KGS_TO_GPM_WATER
+
+def lpm_to_gpm(lpm: float | np.ndarray) -> float | np.ndarray:
     return lpm * LPM_TO_GPM
 
-def gpm_to_lpm(gpm: float) -> float:
+def gpm_to_lpm(gpm: float | np.ndarray) -> float | np.ndarray:
     return gpm * GPM_TO_LPM
@@ -0,0 +1,51 @@
+"""Shared fixtures for the test suite."""
+import pytest
+from defaults import (
+    default_enclosure,
+    default_heat_loads,
+    default_cooling_plant,
+    default_ambient,
+)
+from src.solvers import solve_airflow, solve_coolant_flow, solve_heater_requirement
+
+
+# Built once per session; tests treat them as read-only
+@pytest.fixture(scope="session")
+def enclosure():
+    return default_enclosure()
+
+
+@pytest.fixture(scope="session")
+def loads():
+    return default_heat_loads()
+
+
+@pytest.fixture(scope="session")
+def cooling():
+    return default_cooling_plant()
+
+
+@pytest.fixture(scope="session")
+def ambient():
+    return default_ambient()
+
+
+@pytest.fixture(scope="session")
+def default_results(loads, cooling, ambient):
+    """Solver outputs for the default case, solved once per session."""
+    return {
+        "air": solve_airflow(
+            q_total_w=loads.total_load_w,
+            delta_t_air_c=cooling.delta_t_air_c,
+        ),
+        "water": solve_coolant_flow(
+            q_total_w=loads.total_load_w,
+            delta_t_water_c=cooling.delta_t_water_c,
+        ),
+        "heater": solve_heater_requirement(
+            q_load_w=loads.total_load_w,
+            ua_value=ambient.ua_value,
+            ambient_temp_c=ambient.temperature_c,
+            setpoint_c=ambient.temperature_c,
+        ),
+    }
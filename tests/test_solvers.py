@@ -10,48 +10,58 @@ from src.solvers import (
     solve_coolant_flow,
     solve_coil_leaving_temp,
     solve_heater_requirement,
+    solve_steady_state,
+    ach_to_ua,
     compute_warnings,
     SolverResult,
+    Warnings,
 )
 from src.constants import AIR_CP, AIR_DENSITY, WATER_CP
 from src.units import m3s_to_cfm, kgs_to_lpm
 
+# Hand-calculated references for the 100 W spec cases
+_EXPECTED_AIRFLOW_100_5 = 100.0 / (AIR_CP * 5.0) / AIR_DENSITY   # m³/s
+_EXPECTED_COOLANT_100_2 = 100.0 / (WATER_CP * 2.0)               # kg/s
+
 
 class TestSolveAirflow:
     """m_dot = Q / (c_p * ΔT_air), then convert to CFM."""
 
-    def test_100w_5c_delta(self):
-        result = solve_airflow(q_total_w=100.0, delta_t_air_c=5.0)
-        cfm = m3s_to_cfm(result.airflow_m3s)
-        assert 35.0 <= cfm <= 42.0
+    @pytest.mark.parametrize("q,dt,lo,hi", [
+        (100.0, 5.0, 35.0, 42.0),   # spec: 100 W, ΔT_air=5°C → 35–40 CFM
+        (0.0, 5.0, 0.0, 0.0),       # zero load
+        (100.0, 1.0, 150.0, 1e9),   # small ΔT → large flow
+    ])
+    def test_airflow_range(self, q, dt, lo, hi):
+        result = solve_airflow(q_total_w=q, delta_t_air_c=dt)
+        assert lo <= result.airflow_cfm <= hi
 
     def test_analytical_value(self):
         result = solve_airflow(q_total_w=100.0, delta_t_air_c=5.0)
-        expected_m3s = 100.0 / (AIR_CP * 5.0) / AIR_DENSITY
-        assert result.airflow_m3s == pytest.approx(expected_m3s, rel=1e-6)
+        assert result.airflow_m3s == pytest.approx(_EXPECTED_AIRFLOW_100_5, rel=1e-6)
+
+    def test_zero_delta_t_raises(self):
+        with pytest.raises(ValueError):
+            solve_airflow(q_total_w=100.0, delta_t_air_c=0.0)
 
-    def test_zero_load(self):
-        result = solve_airflow(q_total_w=0.0, delta_t_air_c=5.0)
-        assert result.airflow_m3s == pytest.approx(0.0)
 
-    def test_small_delta_t_large_flow(self):
-        result = solve_airflow(q_total_w=100.0, delta_t_air_c=1.0)
-        cfm = m3s_to_cfm(result.airflow_m3s)
-        assert cfm > 150.0
+@pytest.fixture(scope="class")
+def coolant_100w_2c():
+    return solve_coolant_flow(q_total_w=100.0, delta_t_water_c=2.0)
 
 
 class TestSolveCoolantFlow:
     """m_dot_water = Q / (c_p_water * ΔT_water)."""
 
-    def test_100w_2c_delta(self):
-        result = solve_coolant_flow(q_total_w=100.0, delta_t_water_c=2.0)
-        lpm = kgs_to_lpm(result.coolant_kgs)
-        assert lpm == pytest.approx(0.72, rel=5e-2)
+    def test_100w_2c_delta(self, coolant_100w_2c):
+        assert coolant_100w_2c.coolant_lpm == pytest.approx(0.72, rel=5e-2)
 
-    def test_analytical_value(self):
-        result = solve_coolant_flow(q_total_w=100.0, delta_t_water_c=2.0)
-        expected_kgs = 100.0 / (WATER_CP * 2.0)
-        assert result.coolant_kgs == pytest.approx(expected_kgs, rel=1e-6)
+    def test_analytical_value(self, coolant_100w_2c):
+        assert coolant_100w_2c.coolant_kgs == pytest.approx(_EXPECTED_COOLANT_100_2, rel=1e-6)
+
+    def test_zero_delta_t_raises(self):
+        with pytest.raises(ValueError):
+            solve_coolant_flow(q_total_w=100.0, delta_t_water_c=0.0)
 
 
 class TestSolveCoilLeavingTemp:
@@ -83,19 +93,75 @@ class TestSolveHeaterRequirement:
         assert result.heater_required_w == pytest.approx(7.0, rel=1e-3)
 
 
+class TestSolveSteadyState:
+    """Fused solve must match the individual solvers."""
+
+    def test_matches_individual_solvers(self):
+        result = solve_steady_state(
+            q_total_w=100.0, delta_t_air_c=5.0, delta_t_water_c=2.0,
+            ua_value=2.0, ambient_temp_c=15.0, setpoint_c=23.5,
+            coil_max_capacity_w=500.0,
+        )
+        air = solve_airflow(q_total_w=100.0, delta_t_air_c=5.0)
+        coolant = solve_coolant_flow(q_total_w=100.0, delta_t_water_c=2.0)
+        coil = solve_coil_leaving_temp(
+            q_total_w=100.0, airflow_kgs=air.airflow_kgs, return_air_temp_c=23.5,
+        )
+        heater = solve_heater_requirement(
+            q_load_w=100.0, ua_value=2.0, ambient_temp_c=15.0, setpoint_c=23.5,
+        )
+        assert result.airflow_m3s == pytest.approx(air.airflow_m3s, rel=1e-9)
+        assert result.airflow_kgs == pytest.approx(air.airflow_kgs, rel=1e-9)
+        assert result.coolant_kgs == pytest.approx(coolant.coolant_kgs, rel=1e-9)
+        assert result.coil_leaving_temp_c == pytest.approx(coil.coil_leaving_temp_c, rel=1e-9)
+        assert result.heater_required_w == pytest.approx(heater.heater_required_w)
+        assert result.coil_utilization_pct == pytest.approx(20.0)
+
+    def test_display_unit_flows(self):
+        result = solve_steady_state(
+            q_total_w=100.0, delta_t_air_c=5.0, delta_t_water_c=2.0,
+            ua_value=2.0, ambient_temp_c=15.0, setpoint_c=23.5,
+            coil_max_capacity_w=500.0,
+        )
+        assert result.airflow_cfm == pytest.approx(m3s_to_cfm(result.airflow_m3s))
+        assert result.coolant_lpm == pytest.approx(kgs_to_lpm(result.coolant_kgs))
+
+    def test_zero_load(self):
+        result = solve_steady_state(
+            q_total_w=0.0, delta_t_air_c=5.0, delta_t_water_c=2.0,
+            ua_value=2.0, ambient_temp_c=23.5, setpoint_c=23.5,
+            coil_max_capacity_w=500.0,
+        )
+        assert result.airflow_m3s == pytest.approx(0.0)
+        assert result.coil_leaving_temp_c == pytest.approx(18.5)
+
+
+class TestAchToUa:
+    """UA = ACH * V * ρ * c_p / 3600."""
+
+    def test_analytical_value(self):
+        ua = ach_to_ua(ach=0.5, volume_m3=2.83)
+        expected = 0.5 * 2.83 * AIR_DENSITY * AIR_CP / 3600.0
+        assert ua == pytest.approx(expected, rel=1e-6)
+
+    def test_zero_ach(self):
+        assert ach_to_ua(ach=0.0, volume_m3=2.83) == pytest.approx(0.0)
+
+
 class TestComputeWarnings:
     def test_no_warnings_nominal(self):
         warnings = compute_warnings(coil_utilization_pct=50.0, heater_required_w=0.0)
-        assert len(warnings) == 0
+        assert warnings == Warnings()
 
     def test_coil_warning_high_utilization(self):
         warnings = compute_warnings(coil_utilization_pct=92.0, heater_required_w=0.0)
-        assert any("utilization" in w.lower() for w in warnings)
+        assert any("utilization" in w.lower() for w in warnings.warnings)
+        assert not warnings.errors
 
     def test_coil_error_saturated(self):
         warnings = compute_warnings(coil_utilization_pct=105.0, heater_required_w=0.0)
-        assert any("saturated" in w.lower() for w in warnings)
+        assert any("saturated" in w.lower() for w in warnings.errors)
 
     def test_heater_warning(self):
         warnings = compute_warnings(coil_utilization_pct=10.0, heater_required_w=15.0)
-        assert any("heater" in w.lower() for w in warnings)
+        assert any("heater" in w.lower() for w in warnings.infos)
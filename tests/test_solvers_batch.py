@@ -0,0 +1,44 @@
+"""Tests for the vectorized steady-state solver."""
+import numpy as np
+import pytest
+from src.solvers import solve_steady_state
+from src.solvers_batch import solve_steady_state_batch
+
+
+class TestSolveSteadyStateBatch:
+    def test_matches_scalar_solver(self):
+        q = np.array([0.0, 50.0, 100.0, 400.0])
+        ua = np.array([0.5, 2.0, 5.0, 10.0])
+        batch = solve_steady_state_batch(
+            q_total_w=q, delta_t_air_c=5.0, delta_t_water_c=2.0,
+            ua_value=ua, ambient_temp_c=15.0, setpoint_c=23.5,
+            coil_max_capacity_w=500.0,
+        )
+        for i in range(len(q)):
+            scalar = solve_steady_state(
+                q_total_w=q[i], delta_t_air_c=5.0, delta_t_water_c=2.0,
+                ua_value=ua[i], ambient_temp_c=15.0, setpoint_c=23.5,
+                coil_max_capacity_w=500.0,
+            )
+            for name in scalar._fields:
+                assert getattr(batch, name)[i] == pytest.approx(
+                    getattr(scalar, name), rel=1e-9, abs=1e-12
+                )
+
+    def test_broadcasts_grid(self):
+        q = np.linspace(50.0, 200.0, 4)[:, None]
+        dt_air = np.array([2.0, 5.0, 8.0])[None, :]
+        batch = solve_steady_state_batch(
+            q_total_w=q, delta_t_air_c=dt_air, delta_t_water_c=2.0,
+            ua_value=2.0, ambient_temp_c=23.5, setpoint_c=23.5,
+            coil_max_capacity_w=500.0,
+        )
+        assert batch.airflow_m3s.shape == (4, 3)
+
+    def test_zero_delta_t_raises(self):
+        with pytest.raises(ValueError):
+            solve_steady_state_batch(
+                q_total_w=[100.0, 100.0], delta_t_air_c=[5.0, 0.0],
+                delta_t_water_c=2.0, ua_value=2.0, ambient_temp_c=23.5,
+                setpoint_c=23.5, coil_max_capacity_w=500.0,
+            )